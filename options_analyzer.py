@@ -1,26 +1,160 @@
 #!/usr/bin/env python3
-import yfinance as yf
-import pandas as pd
+# yfinance, pandas and numba are slow to import, so they are imported
+# inside the functions that use them - the welcome banner shows up instantly
 import numpy as np
-from datetime import datetime, date
+from datetime import date
 import sys
-from tabulate import tabulate
+import argparse
+import contextlib
+import os
+import math
+import time
+import pickle
+import hashlib
+import bisect
+from collections import namedtuple
+from functools import lru_cache
+
+# Integer strategy ids, so the calculations branch on cheap int compares (and
+# the Numba kernel, which can't take strings, can use the same ids)
+CALL, PUT, COVERED_CALL, CASH_SECURED_PUT = 0, 1, 2, 3
+_STRATEGY_IDS = {'call': CALL, 'put': PUT, 'covered_call': COVERED_CALL, 'cash_secured_put': CASH_SECURED_PUT}
+
+# Which option leg each strategy trades; selected_data keys are '<leg>_strike' and '<leg>_option'
+_LEG_KIND = {'call': 'call', 'covered_call': 'call', 'put': 'put', 'cash_secured_put': 'put'}
+
+# Filtered options kept as parallel arrays (one entry per contract) plus the
+# matching rows of the original options chain
+FilteredOptions = namedtuple('FilteredOptions', 'strike premium breakeven cost remaining_budget volume open_interest rows')
+
+# Filtered options with their returns at the target price, sorted by annualized return
+RankedOptions = namedtuple('RankedOptions', 'strike premium breakeven profit percent_return annualized_return volume open_interest rows')
+
+# Outcome of holding the selected option to expiration at the expected price
+FutureResults = namedtuple('FutureResults', 'strategy days_to_expiration future_price strike premium value_at_expiration profit percent_return annualized_return current_price')
+
+# In-process caches so repeated lookups don't go back to Yahoo Finance
+_ticker_cache = {}  # ticker symbol -> yf.Ticker
+_chain_cache = {}  # (ticker symbol, expiration) -> (calls, puts, underlying price)
+
+# Maximum number of symbols per batched price download
+PRICE_BATCH_SIZE = 20
+
+# How long responses stay valid in the on-disk cache (seconds)
+EXPIRATIONS_TTL = 60 * 60
+QUOTES_TTL = 60  # Quotes are only meaningful per minute
+
+class FileCache:
+    """On-disk cache of Yahoo Finance responses with a time-to-live per entry"""
+    
+    def __init__(self, directory):
+        self.directory = directory
+    
+    def _path(self, ticker_symbol, endpoint, params):
+        # The symbol is user input, so it goes into the hash too - never into the path as-is
+        digest = hashlib.md5(repr((ticker_symbol, endpoint, params)).encode()).hexdigest()
+        return os.path.join(self.directory, f"{endpoint}_{digest}.pkl")
+    
+    def get_or_fetch(self, key, ttl, fetch_fn, valid=bool):
+        """Return the cached value for key (ticker, endpoint, params) if younger than ttl, otherwise fetch and store it
+        
+        Fetched values that fail valid (by default: empty or None) are returned but not
+        stored, so a failed or empty response from Yahoo isn't served again until the TTL runs out.
+        """
+        path = self._path(*key)
+        try:
+            with open(path, 'rb') as f:
+                entry = pickle.load(f)
+            if time.time() - entry['ts'] < ttl:
+                return entry['data']
+        except Exception:
+            pass  # Missing, unreadable or stale entry - fetch a fresh copy
+        
+        data = fetch_fn()
+        if not valid(data):
+            return data
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            with open(path, 'wb') as f:
+                pickle.dump({'ts': time.time(), 'data': data}, f)
+        except OSError:
+            pass  # Caching is best effort, never fail the lookup because of it
+        return data
+
+_file_cache = FileCache(os.path.join(os.path.dirname(os.path.abspath(__file__)), '.cache'))
 
 def get_ticker_data(ticker_symbol):
     """Fetch ticker data from Yahoo Finance"""
+    if ticker_symbol in _ticker_cache:
+        return _ticker_cache[ticker_symbol]
+    
     print(f"\n📊 Fetching data for {ticker_symbol}...")
     try:
+        import yfinance as yf
         ticker = yf.Ticker(ticker_symbol)
+        _ticker_cache[ticker_symbol] = ticker
         return ticker
     except Exception as e:
         print(f"❌ Error fetching data for {ticker_symbol}: {e}")
         return None
 
+def fetch_expirations(ticker):
+    """Fetch the available expiration dates for a ticker (cached on disk)"""
+    return _file_cache.get_or_fetch((ticker.ticker, 'options', None), EXPIRATIONS_TTL, lambda: ticker.options)
+
+def fetch_info(ticker):
+    """Fetch the info blob for a ticker (cached on disk)"""
+    return _file_cache.get_or_fetch((ticker.ticker, 'info', None), QUOTES_TTL, lambda: ticker.info)
+
+def fetch_last_price(ticker):
+    """Fetch the current price for a ticker from the lightweight fast_info data (cached on disk)
+    
+    Only falls back to downloading the full info blob if fast_info has no price.
+    """
+    def fetch():
+        try:
+            price = ticker.fast_info['last_price']
+        except KeyError:
+            price = None
+        if price is None:
+            price = fetch_info(ticker).get('regularMarketPrice', None)
+        return price
+    
+    return _file_cache.get_or_fetch((ticker.ticker, 'last_price', None), QUOTES_TTL, fetch)
+
+def fetch_prices(symbols):
+    """Fetch the latest price for several ticker symbols with batched requests
+    
+    Symbols are downloaded PRICE_BATCH_SIZE at a time, one request per batch.
+    Returns a dict of symbol -> price; symbols without data are left out.
+    """
+    import yfinance as yf
+    import pandas as pd
+    
+    prices = {}
+    for start in range(0, len(symbols), PRICE_BATCH_SIZE):
+        chunk = symbols[start:start + PRICE_BATCH_SIZE]
+        data = yf.download(' '.join(chunk), period='1d', group_by='ticker', threads=True, progress=False)
+        if data is None or data.empty:
+            continue
+        
+        for symbol in chunk:
+            try:
+                if isinstance(data.columns, pd.MultiIndex):
+                    closes = data[symbol]['Close'].dropna()
+                else:
+                    closes = data['Close'].dropna()
+            except KeyError:
+                continue
+            if not closes.empty:
+                prices[symbol] = float(closes.iloc[-1])
+    return prices
+
 def get_options_chain(ticker):
     """Get available expiration dates and options chains"""
     print("\n📅 Retrieving available options expiration dates...")
     try:
-        expirations = ticker.options
+        expirations = fetch_expirations(ticker)
         if not expirations:
             print(f"❌ No options available for {ticker.ticker}")
             return None, None
@@ -58,15 +192,17 @@ def select_expiration(expirations):
         except ValueError:
             # Not a number, try to parse as date
             try:
-                target_date = datetime.strptime(choice, '%Y-%m-%d').date()
-                # Convert all expiration strings to date objects
-                exp_dates = [datetime.strptime(exp, '%Y-%m-%d').date() for exp in expirations]
+                target_date = date.fromisoformat(choice)
                 
-                # Find closest date using absolute difference
-                closest_index = min(range(len(exp_dates)), key=lambda i: abs((exp_dates[i] - target_date).days))
-                closest_date = expirations[closest_index]
+                # Expirations are sorted ISO date strings, so string order is date order
+                # and the closest date is one of the two around the insertion point
+                insert_index = bisect.bisect_left(expirations, target_date.isoformat())
+                candidates = [i for i in (insert_index - 1, insert_index) if 0 <= i < len(expirations)]
                 
-                days_diff = abs((exp_dates[closest_index] - target_date).days)
+                # Find closest date using absolute difference
+                days_diffs = [abs((date.fromisoformat(expirations[i]) - target_date).days) for i in candidates]
+                days_diff = min(days_diffs)
+                closest_date = expirations[candidates[days_diffs.index(days_diff)]]
                 if days_diff == 0:
                     print(f"✅ Found exact match: {closest_date}")
                 else:
@@ -77,17 +213,35 @@ def select_expiration(expirations):
                 print("❌ Invalid format. Please enter a number or date in YYYY-MM-DD format.")
 
 def get_options_for_expiration(ticker, expiration):
-    """Get calls and puts for a specific expiration date"""
+    """Get calls and puts for a specific expiration date
+    
+    Also returns the underlying stock price included in the chain response,
+    or None if Yahoo didn't send one.
+    """
+    cache_key = (ticker.ticker, expiration)
+    if cache_key in _chain_cache:
+        return _chain_cache[cache_key]
+    
     print(f"\n🔍 Fetching options chain for {expiration}...")
     try:
-        options = ticker.option_chain(expiration)
-        calls = options.calls
-        puts = options.puts
+        def fetch_chain():
+            options = ticker.option_chain(expiration)
+            underlying = getattr(options, 'underlying', None) or {}
+            return options.calls, options.puts, underlying.get('regularMarketPrice')
+        
+        def has_options(chain):
+            calls, puts, _ = chain
+            return calls is not None and puts is not None and not (calls.empty and puts.empty)
+        
+        calls, puts, underlying_price = _file_cache.get_or_fetch(
+            (ticker.ticker, 'option_chain', expiration), QUOTES_TTL, fetch_chain, valid=has_options
+        )
         print(f"✅ Found {len(calls)} call options and {len(puts)} put options.")
-        return calls, puts
+        _chain_cache[cache_key] = (calls, puts, underlying_price)
+        return calls, puts, underlying_price
     except Exception as e:
         print(f"❌ Error getting options for {expiration}: {e}")
-        return None, None
+        return None, None, None
 
 def parse_float(input_str):
     """More lenient float parsing that handles various formats"""
@@ -103,111 +257,155 @@ def parse_float(input_str):
             # If still fails, raise exception
             raise ValueError(f"Cannot convert '{input_str}' to a number")
 
-def filter_options_by_investment(options, strategy, investment_amount, stock_price=None, target_breakeven=None):
-    """Filter options based on investment amount and target breakeven price"""
-    filtered_options = []
+def _rows_column(rows, name):
+    """Return a numeric column of the options chain as an array, all NaN if the chain doesn't have it"""
+    if name not in rows:
+        return np.full(len(rows), np.nan)
+    return rows[name].to_numpy(dtype=float, na_value=np.nan)
+
+def filter_options_by_investment(options, strategy, investment_amount, stock_price=None, target_breakeven=None, min_volume=None):
+    """Filter options based on investment amount, target breakeven price and (optionally) minimum volume"""
+    # Work on whole columns at once instead of iterating row by row
+    strike = options['strike'].to_numpy(dtype=float)
+    premium = options['lastPrice'].to_numpy(dtype=float)
+
+    # Calculate cost and breakeven
+    strategy_id = _STRATEGY_IDS[strategy]
+    if strategy_id == CALL:
+        contract_cost = premium * 100  # One contract = 100 shares
+        breakeven = strike + premium
+        # For calls, we want strike + premium < target_breakeven
+        below_target = True
+    elif strategy_id == PUT:
+        contract_cost = premium * 100
+        breakeven = strike - premium
+        # For puts, we want strike - premium > target_breakeven
+        below_target = False
+    elif strategy_id == COVERED_CALL:
+        # Cost of 100 shares + premium received
+        contract_cost = (stock_price * 100) - (premium * 100)
+        breakeven = stock_price - premium
+        # For covered calls, we want stock_price - premium < target_breakeven
+        below_target = True
+    elif strategy_id == CASH_SECURED_PUT:
+        # Cash to secure 100 shares at strike price - premium received
+        contract_cost = (strike * 100) - (premium * 100)
+        breakeven = strike - premium
+        # For cash secured puts, we want strike - premium > target_breakeven
+        below_target = False
+
+    # Keep options that meet both investment and breakeven criteria
+    mask = contract_cost <= investment_amount
+    if target_breakeven is not None:
+        mask &= (breakeven < target_breakeven) if below_target else (breakeven > target_breakeven)
     
-    for _, option in options.iterrows():
-        strike = option['strike']
-        premium = option['lastPrice']
-        
-        # Calculate cost and breakeven
-        if strategy == 'call':
-            contract_cost = premium * 100  # One contract = 100 shares
-            breakeven = strike + premium
-            # For calls, we want strike + premium < target_breakeven
-            meets_breakeven_criteria = True if target_breakeven is None else breakeven < target_breakeven
-        elif strategy == 'put':
-            contract_cost = premium * 100
-            breakeven = strike - premium
-            # For puts, we want strike - premium > target_breakeven
-            meets_breakeven_criteria = True if target_breakeven is None else breakeven > target_breakeven
-        elif strategy == 'covered_call':
-            # Cost of 100 shares + premium received
-            contract_cost = (stock_price * 100) - (premium * 100)
-            breakeven = stock_price - premium
-            # For covered calls, we want stock_price - premium < target_breakeven
-            meets_breakeven_criteria = True if target_breakeven is None else breakeven < target_breakeven
-        elif strategy == 'cash_secured_put':
-            # Cash to secure 100 shares at strike price - premium received
-            contract_cost = (strike * 100) - (premium * 100)
-            breakeven = strike - premium
-            # For cash secured puts, we want strike - premium > target_breakeven
-            meets_breakeven_criteria = True if target_breakeven is None else breakeven > target_breakeven
-        
-        # Check if the option meets both investment and breakeven criteria
-        if contract_cost <= investment_amount and meets_breakeven_criteria:
-            filtered_options.append({
-                'strike': strike,
-                'premium': premium,
-                'breakeven': breakeven,
-                'cost': contract_cost,
-                'remaining_budget': investment_amount - contract_cost,
-                'option_data': option
-            })
+    # Drop illiquid contracts - options with no volume data (NaN) never pass
+    volume = _rows_column(options, 'volume')
+    if min_volume is not None:
+        mask &= volume >= min_volume
+
+    # Results stay in chain order; callers that need a particular order sort the arrays themselves
+    cost = contract_cost[mask]
+    return FilteredOptions(
+        strike=strike[mask],
+        premium=premium[mask],
+        breakeven=breakeven[mask],
+        cost=cost,
+        remaining_budget=investment_amount - cost,
+        volume=volume[mask],
+        open_interest=_rows_column(options, 'openInterest')[mask],
+        rows=options.iloc[mask]
+    )
+
+def _format_cell(value):
+    """Convert a table cell to text, showing missing numbers as N/A"""
+    if isinstance(value, str):
+        return value
+    if value != value:  # NaN
+        return 'N/A'
+    return f"{value:.12g}"
+
+def print_table(headers, rows):
+    """Print rows as a box-drawn table, right-aligned, in a single write to stdout"""
+    rows = [[_format_cell(value) for value in row] for row in rows]
+    columns = list(zip(*rows)) or [()] * len(headers)
+    widths = [max([len(header)] + [len(cell) for cell in column]) for header, column in zip(headers, columns)]
     
-    # Sort by strike price
-    filtered_options.sort(key=lambda x: x['strike'])
-    return filtered_options
+    # Build the row template and borders once, then format every row with it
+    fmt = "│ " + " │ ".join(f"{{:>{width}}}" for width in widths) + " │"
+    top = "┌─" + "─┬─".join("─" * width for width in widths) + "─┐"
+    separator = "├─" + "─┼─".join("─" * width for width in widths) + "─┤"
+    bottom = "└─" + "─┴─".join("─" * width for width in widths) + "─┘"
+    
+    lines = [top, fmt.format(*headers), separator]
+    lines.extend(fmt.format(*row) for row in rows)
+    lines.append(bottom)
+    sys.stdout.write("\n".join(lines) + "\n")
+
+def _format_money(value):
+    """Format a dollar amount for display"""
+    return f"${value:.2f}"
+
+def _format_percent(value):
+    """Format a percentage for display"""
+    return f"{value:.2f}%"
 
 def display_filtered_options(filtered_options, strategy):
-    """Display filtered options in a readable format using tabulate library"""
-    if not filtered_options:
+    """Display filtered options in a readable table"""
+    count = len(filtered_options.strike)
+    if count == 0:
         print("\n❌ No options match your criteria.")
         return
     
-    print(f"\n✅ Found {len(filtered_options)} options matching your criteria:")
+    print(f"\n✅ Found {count} options matching your criteria:")
     
-    # Create a list to hold table data
-    table_data = []
+    import pandas as pd
+    strike = filtered_options.strike
+    premium = filtered_options.premium
     
-    # Add headers based on strategy
+    # Pick the last columns based on strategy
     if strategy in ['call', 'put']:
-        headers = ["Num", "Strike Price", "Premium", "Breakeven", "Cost/Contract", "Remaining Budget", "Volume", "Open Int"]
-        
-        # Add data rows
-        for i, opt in enumerate(filtered_options):
-            volume = opt['option_data'].get('volume', 'N/A')
-            open_int = opt['option_data'].get('openInterest', 'N/A')
-            
-            row = [
-                i+1,
-                f"${opt['strike']:.2f}",
-                f"${opt['premium']:.2f}",
-                f"${opt['breakeven']:.2f}",
-                f"${opt['cost']:.2f}",
-                f"${opt['remaining_budget']:.2f}",
-                volume,
-                open_int
-            ]
-            table_data.append(row)
+        extra_columns = {
+            'Cost/Contract': filtered_options.cost,
+            'Remaining Budget': filtered_options.remaining_budget
+        }
+        extra_formatters = {'Remaining Budget': _format_money}
     else:  # covered_call or cash_secured_put
-        headers = ["Num", "Strike Price", "Premium", "Breakeven", "Required Capital", "Return %", "Volume", "Open Int"]
-        
-        # Add data rows
-        for i, opt in enumerate(filtered_options):
-            volume = opt['option_data'].get('volume', 'N/A')
-            open_int = opt['option_data'].get('openInterest', 'N/A')
-            
-            if strategy == 'covered_call':
-                return_pct = (opt['premium'] / (opt['strike'] - opt['premium'])) * 100
-            else:  # cash_secured_put
-                return_pct = (opt['premium'] / opt['strike']) * 100
-                
-            row = [
-                i+1,
-                f"${opt['strike']:.2f}",
-                f"${opt['premium']:.2f}",
-                f"${opt['breakeven']:.2f}",
-                f"${opt['cost']:.2f}",
-                f"{return_pct:.2f}%",
-                volume,
-                open_int
-            ]
-            table_data.append(row)
-    
-    # Create and display table using tabulate with grid format
-    print(tabulate(table_data, headers=headers, tablefmt="grid"))
+        if strategy == 'covered_call':
+            return_pct = (premium / (strike - premium)) * 100
+        else:  # cash_secured_put
+            return_pct = (premium / strike) * 100
+        extra_columns = {
+            'Required Capital': filtered_options.cost,
+            'Return %': return_pct
+        }
+        extra_formatters = {'Return %': _format_percent}
+    
+    table = pd.DataFrame({
+        'Strike Price': strike,
+        'Premium': premium,
+        'Breakeven': filtered_options.breakeven,
+        **extra_columns,
+        'Volume': filtered_options.volume,
+        'Open Int': filtered_options.open_interest
+    })
+    
+    # Sort by strike price
+    table = table.iloc[np.argsort(strike, kind='stable')]
+    table.insert(0, 'Num', np.arange(1, count + 1))
+    
+    # Format every column in one to_string pass
+    formatters = {
+        'Strike Price': _format_money,
+        'Premium': _format_money,
+        'Breakeven': _format_money,
+        'Cost/Contract': _format_money,
+        'Required Capital': _format_money,
+        'Volume': _format_cell,
+        'Open Int': _format_cell,
+        **extra_formatters
+    }
+    print(table.to_string(index=False, formatters=formatters, na_rep='N/A'))
 
 def calculate_pnl(strategy, stock_price, selected_data):
     """Calculate P&L for different strategies across a range of prices"""
@@ -293,110 +491,42 @@ def explain_target_strike():
     print("   For PUTS and CASH SECURED PUTS: Shows options with breakeven ABOVE your target.")
     print("\n   If you leave this blank, all options that fit your investment budget will be shown.")
 
+@lru_cache(maxsize=1024)
+def _option_returns(strategy, future_price, strike, premium, current_price, days_to_expiration):
+    """Value, profit, percent and annualized return of a single option, memoized on its inputs"""
+    # Same calculation as for the whole chain, on a single option
+    return tuple(
+        column[0] for column in _strategy_returns(
+            strategy, np.array([strike], dtype=float), np.array([premium], dtype=float),
+            future_price, days_to_expiration, current_price
+        )
+    )
+
 def calculate_option_value(strategy, future_price, selected_data, expiration_date):
     """Calculate option value at a specific future price"""
-    strike = None
-    premium = None
     current_price = selected_data.get('stock_price')
+    days_to_expiration = _days_to_expiration(expiration_date)
     
-    # Get days until expiration
-    exp_date = datetime.strptime(expiration_date, '%Y-%m-%d').date()
-    today = date.today()
-    days_to_expiration = (exp_date - today).days
-    if days_to_expiration <= 0:
-        days_to_expiration = 1  # Avoid division by zero
+    leg = _LEG_KIND[strategy]
+    strike = selected_data[f'{leg}_strike']
+    premium = selected_data[f'{leg}_option']['lastPrice']
     
-    if strategy == 'call':
-        strike = selected_data['call_strike']
-        premium = selected_data['call_option']['lastPrice']
-        # Calculate intrinsic value at expiration
-        if future_price > strike:
-            value = future_price - strike
-        else:
-            value = 0
-        
-        # Calculate dollar profit/loss
-        profit = value - premium
-        
-        # Calculate percentage return
-        if premium > 0:
-            percent_return = (profit / premium) * 100
-        else:
-            percent_return = 0
-            
-        # Calculate annualized return
-        annualized_return = ((1 + (percent_return / 100)) ** (365 / days_to_expiration) - 1) * 100
-        
-    elif strategy == 'put':
-        strike = selected_data['put_strike']
-        premium = selected_data['put_option']['lastPrice']
-        # Calculate intrinsic value at expiration
-        if future_price < strike:
-            value = strike - future_price
-        else:
-            value = 0
-            
-        # Calculate dollar profit/loss
-        profit = value - premium
-        
-        # Calculate percentage return
-        if premium > 0:
-            percent_return = (profit / premium) * 100
-        else:
-            percent_return = 0
-            
-        # Calculate annualized return
-        annualized_return = ((1 + (percent_return / 100)) ** (365 / days_to_expiration) - 1) * 100
-        
-    elif strategy == 'covered_call':
-        strike = selected_data['call_strike']
-        premium = selected_data['call_option']['lastPrice']
-        # Stock P&L + option premium
-        stock_profit = future_price - current_price
-        
-        if future_price > strike:
-            option_value = -(future_price - strike)  # Loss on the short call
-        else:
-            option_value = 0  # Option expires worthless
-            
-        profit = stock_profit + premium + option_value
-        
-        # Calculate percentage return on investment
-        investment = current_price  # Cost of 100 shares (simplified)
-        percent_return = (profit / investment) * 100
-        
-        # Calculate annualized return
-        annualized_return = ((1 + (percent_return / 100)) ** (365 / days_to_expiration) - 1) * 100
-        
-    elif strategy == 'cash_secured_put':
-        strike = selected_data['put_strike']
-        premium = selected_data['put_option']['lastPrice']
-        
-        if future_price < strike:
-            option_value = -(strike - future_price)  # Loss on the short put
-        else:
-            option_value = 0  # Option expires worthless
-            
-        profit = premium + option_value
-        
-        # Calculate percentage return on investment (cash secured = strike price)
-        investment = strike  # Amount of cash secured
-        percent_return = (profit / investment) * 100
-        
-        # Calculate annualized return
-        annualized_return = ((1 + (percent_return / 100)) ** (365 / days_to_expiration) - 1) * 100
-    
-    return {
-        'strategy': strategy,
-        'days_to_expiration': days_to_expiration,
-        'future_price': future_price,
-        'strike': strike,
-        'premium': premium,
-        'value_at_expiration': value if 'value' in locals() else option_value,
-        'profit': profit,
-        'percent_return': percent_return,
-        'annualized_return': annualized_return
-    }
+    value, profit, percent_return, annualized_return = _option_returns(
+        strategy, future_price, strike, premium, current_price, days_to_expiration
+    )
+    
+    return FutureResults(
+        strategy=strategy,
+        days_to_expiration=days_to_expiration,
+        future_price=future_price,
+        strike=strike,
+        premium=premium,
+        value_at_expiration=value,
+        profit=profit,
+        percent_return=percent_return,
+        annualized_return=annualized_return,
+        current_price=current_price
+    )
 
 def display_future_results(results):
     """Display the results of future price analysis"""
@@ -408,154 +538,315 @@ def display_future_results(results):
     }
     
     print("\n" + "═" * 70)
-    print(f"📊 ANALYSIS RESULTS FOR EXPECTED FUTURE PRICE: ${results['future_price']:.2f}")
+    print(f"📊 ANALYSIS RESULTS FOR EXPECTED FUTURE PRICE: ${results.future_price:.2f}")
     print("═" * 70)
-    print(f"Strategy: {strategy_names.get(results['strategy'], results['strategy'])}")
-    print(f"Days until expiration: {results['days_to_expiration']}")
-    
-    if results['strategy'] == 'call':
-        print(f"\nCall Strike: ${results['strike']}")
-        print(f"Premium Paid: ${results['premium']:.2f}")
-        print(f"\nAt your expected price of ${results['future_price']:.2f}:")
-        print(f"Option Value at Expiration: ${results['value_at_expiration']:.2f}")
-        print(f"Profit/Loss: ${results['profit']:.2f}")
-        print(f"Percentage Return: {results['percent_return']:.2f}%")
-        print(f"Annualized Return: {results['annualized_return']:.2f}%")
+    print(f"Strategy: {strategy_names.get(results.strategy, results.strategy)}")
+    print(f"Days until expiration: {results.days_to_expiration}")
+    
+    if results.strategy == 'call':
+        print(f"\nCall Strike: ${results.strike}")
+        print(f"Premium Paid: ${results.premium:.2f}")
+        print(f"\nAt your expected price of ${results.future_price:.2f}:")
+        print(f"Option Value at Expiration: ${results.value_at_expiration:.2f}")
+        print(f"Profit/Loss: ${results.profit:.2f}")
+        print(f"Percentage Return: {results.percent_return:.2f}%")
+        print(f"Annualized Return: {results.annualized_return:.2f}%")
         
-    elif results['strategy'] == 'put':
-        print(f"\nPut Strike: ${results['strike']}")
-        print(f"Premium Paid: ${results['premium']:.2f}")
-        print(f"\nAt your expected price of ${results['future_price']:.2f}:")
-        print(f"Option Value at Expiration: ${results['value_at_expiration']:.2f}")
-        print(f"Profit/Loss: ${results['profit']:.2f}")
-        print(f"Percentage Return: {results['percent_return']:.2f}%")
-        print(f"Annualized Return: {results['annualized_return']:.2f}%")
+    elif results.strategy == 'put':
+        print(f"\nPut Strike: ${results.strike}")
+        print(f"Premium Paid: ${results.premium:.2f}")
+        print(f"\nAt your expected price of ${results.future_price:.2f}:")
+        print(f"Option Value at Expiration: ${results.value_at_expiration:.2f}")
+        print(f"Profit/Loss: ${results.profit:.2f}")
+        print(f"Percentage Return: {results.percent_return:.2f}%")
+        print(f"Annualized Return: {results.annualized_return:.2f}%")
         
-    elif results['strategy'] == 'covered_call':
-        print(f"\nCurrent Stock Price: ${results.get('current_price', 'N/A')}")
-        print(f"Call Strike: ${results['strike']}")
-        print(f"Premium Received: ${results['premium']:.2f}")
-        print(f"\nAt your expected price of ${results['future_price']:.2f}:")
-        print(f"Profit/Loss: ${results['profit']:.2f}")
-        print(f"Percentage Return: {results['percent_return']:.2f}%")
-        print(f"Annualized Return: {results['annualized_return']:.2f}%")
+    elif results.strategy == 'covered_call':
+        print(f"\nCurrent Stock Price: ${'N/A' if results.current_price is None else f'{results.current_price:.2f}'}")
+        print(f"Call Strike: ${results.strike}")
+        print(f"Premium Received: ${results.premium:.2f}")
+        print(f"\nAt your expected price of ${results.future_price:.2f}:")
+        print(f"Profit/Loss: ${results.profit:.2f}")
+        print(f"Percentage Return: {results.percent_return:.2f}%")
+        print(f"Annualized Return: {results.annualized_return:.2f}%")
         
-    elif results['strategy'] == 'cash_secured_put':
-        print(f"\nPut Strike: ${results['strike']}")
-        print(f"Premium Received: ${results['premium']:.2f}")
-        print(f"\nAt your expected price of ${results['future_price']:.2f}:")
-        print(f"Profit/Loss: ${results['profit']:.2f}")
-        print(f"Percentage Return: {results['percent_return']:.2f}%")
-        print(f"Annualized Return: {results['annualized_return']:.2f}%")
+    elif results.strategy == 'cash_secured_put':
+        print(f"\nPut Strike: ${results.strike}")
+        print(f"Premium Received: ${results.premium:.2f}")
+        print(f"\nAt your expected price of ${results.future_price:.2f}:")
+        print(f"Profit/Loss: ${results.profit:.2f}")
+        print(f"Percentage Return: {results.percent_return:.2f}%")
+        print(f"Annualized Return: {results.annualized_return:.2f}%")
     
     print("\nNote: These calculations assume holding until expiration.")
     print("═" * 70)
 
-def calculate_annualized_returns(filtered_options, strategy, target_price, expiration_date):
-    """Calculate annualized returns for all filtered options at the target price"""
-    today = date.today()
-    exp_date = datetime.strptime(expiration_date, '%Y-%m-%d').date()
-    days_to_expiration = max(1, (exp_date - today).days)  # Ensure at least 1 day
-    
-    results = []
-    for opt in filtered_options:
-        strike = opt['strike']
-        premium = opt['premium']
+def _days_to_expiration(expiration_date):
+    """Days from today until expiration, at least 1 to avoid dividing by zero"""
+    return max(1, (date.fromisoformat(expiration_date) - date.today()).days)
+
+# Chains at least this long use the Numba kernel when Numba is installed. Below
+# that NumPy is already fast and the parallel dispatch overhead isn't worth it.
+JIT_MIN_OPTIONS = 1000
+
+_returns_kernel = None  # Compiled by _get_returns_kernel on first use, False without Numba
+
+def _get_returns_kernel():
+    """Return the Numba returns kernel, compiling it on first use, or None if Numba isn't installed"""
+    global _returns_kernel
+    if _returns_kernel is None:
+        _returns_kernel = _compile_returns_kernel()
+    return _returns_kernel or None
+
+def _compile_returns_kernel():
+    """Build the Numba returns kernel, or return False if Numba isn't installed"""
+    try:
+        from numba import njit, prange
+    except ImportError:  # Numba is optional; without it the NumPy implementation is used
+        return False
+    
+    @njit(cache=True, parallel=True)
+    def kernel(strategy_id, strike, premium, target_price, days_to_expiration, has_current_price, current_price):
+        """Single fused pass of _strategy_returns, strategy_id is one of the strategy id constants"""
+        n = strike.shape[0]
+        option_value = np.empty(n)
+        profit = np.empty(n)
+        percent_return = np.empty(n)
+        annualized_return = np.empty(n)
+        exponent = 365 / days_to_expiration  # Same for every option, computed once
         
-        # Calculate profit at target price based on strategy
-        if strategy == 'call':
-            if target_price > strike:
-                option_value = target_price - strike
-            else:
-                option_value = 0
-            profit = option_value - premium
-            investment = premium
-            
-        elif strategy == 'put':
-            if target_price < strike:
-                option_value = strike - target_price
-            else:
-                option_value = 0
-            profit = option_value - premium
-            investment = premium
-            
-        elif strategy == 'covered_call':
-            current_price = opt.get('stock_price', strike)  # Fallback to strike if stock price unknown
-            stock_profit = target_price - current_price
+        for i in prange(n):
+            if strategy_id == CALL:
+                value = max(target_price - strike[i], 0.0)
+                gain = value - premium[i]
+                investment = premium[i]
+            elif strategy_id == PUT:
+                value = max(strike[i] - target_price, 0.0)
+                gain = value - premium[i]
+                investment = premium[i]
+            elif strategy_id == COVERED_CALL:
+                stock_price = current_price if has_current_price else strike[i]
+                value = -max(target_price - strike[i], 0.0)  # Loss on short call
+                gain = target_price - stock_price + premium[i] + value
+                investment = stock_price
+            else:  # CASH_SECURED_PUT
+                value = -max(strike[i] - target_price, 0.0)  # Loss on short put
+                gain = premium[i] + value
+                investment = strike[i]
             
-            if target_price > strike:
-                option_value = -(target_price - strike)  # Loss on short call
-            else:
-                option_value = 0
-            profit = stock_profit + premium + option_value
-            investment = current_price
-            
-        elif strategy == 'cash_secured_put':
-            if target_price < strike:
-                option_value = -(strike - target_price)  # Loss on short put
-            else:
-                option_value = 0
-            profit = premium + option_value
-            investment = strike
+            pct = gain / investment * 100 if investment > 0 else 0.0
+            option_value[i] = value
+            profit[i] = gain
+            percent_return[i] = pct
+            annualized_return[i] = (math.pow(1 + pct / 100, exponent) - 1) * 100
         
-        # Calculate percentage and annualized returns
-        if investment > 0:
-            percent_return = (profit / investment) * 100
-            annualized_return = ((1 + (percent_return / 100)) ** (365 / days_to_expiration) - 1) * 100
-        else:
-            percent_return = 0
-            annualized_return = 0
+        return option_value, profit, percent_return, annualized_return
+    
+    return kernel
+
+def _strategy_returns(strategy, strike, premium, target_price, days_to_expiration, current_price=None):
+    """Value, profit, percent and annualized return at target_price for arrays of strikes and premiums
+    
+    current_price is the stock price used for covered calls; the strike is used when it's unknown.
+    """
+    strategy_id = _STRATEGY_IDS[strategy]
+    kernel = _get_returns_kernel() if len(strike) >= JIT_MIN_OPTIONS else None
+    if kernel is not None:
+        return kernel(
+            strategy_id, strike, premium, float(target_price), float(days_to_expiration),
+            current_price is not None, 0.0 if current_price is None else float(current_price)
+        )
+    
+    # Calculate profit at target price based on strategy, for every strike at once
+    if strategy_id == CALL:
+        option_value = np.maximum(target_price - strike, 0)
+        profit = option_value - premium
+        investment = premium
+        
+    elif strategy_id == PUT:
+        option_value = np.maximum(strike - target_price, 0)
+        profit = option_value - premium
+        investment = premium
         
-        results.append({
-            'strike': strike,
-            'premium': premium,
-            'breakeven': opt['breakeven'],
-            'profit': profit,
-            'percent_return': percent_return,
-            'annualized_return': annualized_return,
-            'option_data': opt['option_data']
-        })
+    elif strategy_id == COVERED_CALL:
+        current_price = strike if current_price is None else np.full_like(strike, current_price)
+        option_value = -np.maximum(target_price - strike, 0)  # Loss on short call
+        profit = target_price - current_price
+        profit += premium
+        profit += option_value
+        investment = current_price
+        
+    elif strategy_id == CASH_SECURED_PUT:
+        option_value = -np.maximum(strike - target_price, 0)  # Loss on short put
+        profit = premium + option_value
+        investment = strike
+    
+    # Calculate percentage and annualized returns (both stay 0 without an investment)
+    percent_return = np.zeros_like(profit)
+    np.divide(profit, investment, out=percent_return, where=investment > 0)
+    percent_return *= 100
+    
+    annualized_return = percent_return / 100
+    annualized_return += 1
+    np.power(annualized_return, 365 / days_to_expiration, out=annualized_return)
+    annualized_return -= 1
+    annualized_return *= 100
+    
+    return option_value, profit, percent_return, annualized_return
+
+def calculate_annualized_returns(filtered_options, strategy, target_price, expiration_date):
+    """Calculate annualized returns for all filtered options at the target price"""
+    days_to_expiration = _days_to_expiration(expiration_date)
+    strike = filtered_options.strike
+    premium = filtered_options.premium
+    
+    # Stock price is not tracked per option, so covered calls fall back to the strike
+    _, profit, percent_return, annualized_return = _strategy_returns(
+        strategy, strike, premium, target_price, days_to_expiration
+    )
     
     # Sort by annualized return (highest first)
-    results.sort(key=lambda x: x['annualized_return'], reverse=True)
-    return results
+    order = np.argsort(-annualized_return, kind='stable')
+    return RankedOptions(
+        strike=strike[order],
+        premium=premium[order],
+        breakeven=filtered_options.breakeven[order],
+        profit=profit[order],
+        percent_return=percent_return[order],
+        annualized_return=annualized_return[order],
+        volume=filtered_options.volume[order],
+        open_interest=filtered_options.open_interest[order],
+        rows=filtered_options.rows.iloc[order]
+    )
 
 def display_top_returns(options_by_return, strategy, target_price, limit=5):
-    """Display the top options by annualized return using tabulate"""
-    if not options_by_return:
+    """Display the top options by annualized return as a table"""
+    if len(options_by_return.strike) == 0:
         print("\n⚠️ Could not calculate returns for any options at your target price.")
         return
     
     print(f"\n🔝 Top options by annualized return if {target_price:.2f} is reached:")
     
-    # Create table headers and data
-    headers = ["Strike", "Premium", "Breakeven", "Profit", "Return %", "Annual Return"]
-    table_data = []
+    # Build the table for the top N options (or all if less than N)
+    import pandas as pd
+    table = pd.DataFrame({
+        'Strike': options_by_return.strike,
+        'Premium': options_by_return.premium,
+        'Breakeven': options_by_return.breakeven,
+        'Profit': options_by_return.profit,
+        'Return %': options_by_return.percent_return,
+        'Annual Return': options_by_return.annualized_return
+    }).head(limit)
     
-    # Add top N options (or all if less than N)
-    show_limit = min(limit, len(options_by_return))
-    for i in range(show_limit):
-        opt = options_by_return[i]
-        
-        row = [
-            f"${opt['strike']:.2f}",
-            f"${opt['premium']:.2f}",
-            f"${opt['breakeven']:.2f}",
-            f"${opt['profit']:.2f}",
-            f"{opt['percent_return']:.2f}%",
-            f"{opt['annualized_return']:.2f}%"
-        ]
-        table_data.append(row)
-    
-    # Display using tabulate with grid format
-    print(tabulate(table_data, headers=headers, tablefmt="grid"))
+    # Format every column in one to_string pass
+    formatters = {
+        'Strike': _format_money,
+        'Premium': _format_money,
+        'Breakeven': _format_money,
+        'Profit': _format_money,
+        'Return %': _format_percent,
+        'Annual Return': _format_percent
+    }
+    print(table.to_string(index=False, formatters=formatters, na_rep='N/A'))
     
     # Add explanation
     print("\n📝 These options would provide the highest annualized returns")
     print(f"   if the stock reaches ${target_price:.2f} by expiration.")
     print("   Annualized return assumes holding until expiration.")
 
-def main():
+def _format_count_column(values):
+    """Format a numeric volume/open interest column in one pass, showing missing (NaN) entries as N/A"""
+    return np.where(np.isnan(values), 'N/A', np.char.mod('%.12g', values)).tolist()
+
+# Rows shown in the ranking table before the user asks for more
+MAX_ROWS = 25
+
+# Accepted answers at the option selection prompt, matched without lowercasing the input
+_QUIT_INPUTS = frozenset({'q', 'Q'})
+_MORE_INPUTS = frozenset({'m', 'M'})
+
+def display_ranked_options(options_by_return, target_price, limit=None):
+    """Display the ranked options (the first limit of them, or all) as a numbered table, straight from the sorted arrays"""
+    total = len(options_by_return.strike)
+    count = total if limit is None else min(limit, total)
+    print(f"\n📊 Options sorted by highest annualized return if ${target_price:.2f} is reached:")
+    
+    # Create table headers and data for all options, formatting each column
+    # in one vectorized pass instead of one f-string per cell. Volume and open
+    # interest stay numeric (NaN when missing) until this point.
+    headers = ["Num", "Strike", "Premium", "Breakeven", "Profit", "Return %", "Annual Return", "Volume", "Open Int"]
+    table_data = zip(
+        range(1, count + 1),
+        np.char.mod('$%.2f', options_by_return.strike[:count]).tolist(),
+        np.char.mod('$%.2f', options_by_return.premium[:count]).tolist(),
+        np.char.mod('$%.2f', options_by_return.breakeven[:count]).tolist(),
+        np.char.mod('$%.2f', options_by_return.profit[:count]).tolist(),
+        np.char.mod('%.2f%%', options_by_return.percent_return[:count]).tolist(),
+        np.char.mod('%.2f%%', options_by_return.annualized_return[:count]).tolist(),
+        _format_count_column(options_by_return.volume[:count]),
+        _format_count_column(options_by_return.open_interest[:count])
+    )
+    
+    # Display the table
+    print_table(headers, table_data)
+    if count < total:
+        print(f"   Showing the top {count} of {total} options.")
+    
+    print("\n📝 These options are sorted by annualized return if the stock reaches")
+    print(f"   ${target_price:.2f} by expiration. Higher returns may involve higher risks.")
+
+def print_ranked_json(options_by_return, out):
+    """Write the ranked options to out as a JSON array, with missing or infinite numbers as null"""
+    price_fields = ('strike', 'premium', 'breakeven', 'profit', 'percent_return', 'annualized_return')
+    count_fields = ('volume', 'open_interest')
+    columns = [
+        np.where(np.isfinite(column), column, None).tolist()
+        for column in (getattr(options_by_return, field) for field in price_fields)
+    ]
+    # Contract counts are whole numbers, so they're written as ints
+    columns += [
+        np.where(np.isnan(column), None, np.nan_to_num(column).astype(np.int64)).tolist()
+        for column in (getattr(options_by_return, field) for field in count_fields)
+    ]
+    records = [dict(zip(price_fields + count_fields, row)) for row in zip(*columns)]
+    
+    # orjson is optional and much faster on float-heavy payloads; fall back to the standard library
+    try:
+        import orjson
+        out.write(orjson.dumps(records).decode() + "\n")
+    except ImportError:
+        import json
+        out.write(json.dumps(records) + "\n")
+
+def parse_args(argv=None):
+    """Parse the command line options that let scripted runs skip prompts"""
+    parser = argparse.ArgumentParser(description="Analyze options strategies and rank contracts by annualized return.")
+    parser.add_argument('--strategy', choices=['c', 'p', 'cc', 'csp'],
+                        help="strategy code, skips the strategy prompt")
+    parser.add_argument('--future-price', type=parse_float,
+                        help="expected stock price at expiration, skips the price prompt")
+    parser.add_argument('--min-volume', type=int,
+                        help="only show options that traded at least this many contracts")
+    parser.add_argument('--choice', type=int,
+                        help="number of the ranked option to analyze, skips the selection prompt")
+    parser.add_argument('--json', action='store_true',
+                        help="print the ranked options as JSON and exit instead of showing the table")
+    args = parser.parse_args(argv)
+    if args.future_price is not None and args.future_price <= 0:
+        parser.error("--future-price must be greater than zero")
+    return args
+
+def main(argv=None):
+    args = parse_args(argv)
+    if args.json:
+        # stdout carries only the JSON, so the banner, tables, status lines and prompts go to stderr
+        json_out = sys.stdout
+        with contextlib.redirect_stdout(sys.stderr):
+            return run_analysis(args, json_out)
+    return run_analysis(args)
+
+def run_analysis(args, json_out=None):
+    """Run the interactive analysis, writing the ranked options as JSON to json_out when args.json is set"""
     display_welcome()
     
     # Get ticker symbol from user
@@ -564,33 +855,36 @@ def main():
     # Get ticker data
     ticker = get_ticker_data(ticker_symbol)
     if not ticker:
-        sys.exit(1)
-    
-    # Get current stock price
-    try:
-        stock_info = ticker.info
-        stock_price = stock_info.get('regularMarketPrice', None)
-        if stock_price:
-            print(f"💲 Current price for {ticker_symbol}: ${stock_price:.2f}")
-        else:
-            print(f"⚠️ Could not get current price for {ticker_symbol}")
-    except:
-        stock_price = None
-        print(f"⚠️ Could not get current price for {ticker_symbol}")
+        return 1
     
     # Get available expiration dates
     expirations, ticker = get_options_chain(ticker)
     if not expirations:
-        sys.exit(1)
+        return 1
     
     # Let user select expiration date
     selected_expiration = select_expiration(expirations)
     print(f"📅 Selected expiration: {selected_expiration}")
     
     # Get options chain for selected expiration
-    calls, puts = get_options_for_expiration(ticker, selected_expiration)
+    calls, puts, stock_price = get_options_for_expiration(ticker, selected_expiration)
     if calls is None or puts is None:
-        sys.exit(1)
+        return 1
+    
+    # Get current stock price - the options chain normally includes it, so
+    # only look it up separately when it didn't
+    try:
+        if stock_price is None:
+            stock_price = fetch_prices([ticker_symbol]).get(ticker_symbol)
+        if stock_price is None:
+            stock_price = fetch_last_price(ticker)
+        if stock_price:
+            print(f"💲 Current price for {ticker_symbol}: ${stock_price:.2f}")
+        else:
+            print(f"⚠️ Could not get current price for {ticker_symbol}")
+    except:
+        stock_price = None
+        print(f"⚠️ Could not get current price for {ticker_symbol}")
     
     # Let user select strategy
     strategies = {
@@ -628,26 +922,28 @@ def main():
     
     print("┗" + "━" * code_width + "┻" + "━" * desc_width + "┛")
     
-    while True:
+    selected_strategy = strategies.get(args.strategy)
+    if selected_strategy:
+        print(f"\n✅ Selected strategy: {selected_strategy}")
+    while selected_strategy is None:
         strategy_choice = input("\n➡️ Select strategy (c/p/cc/csp): ").lower().strip()
         if strategy_choice in strategies:
             selected_strategy = strategies[strategy_choice]
             print(f"✅ Selected strategy: {selected_strategy}")
-            break
         else:
             print("❌ Invalid selection. Please enter c, p, cc, or csp.")
     
     # Ask for investment amount with custom prompt based on strategy
+    if selected_strategy == 'cash_secured_put':
+        prompt = "\n💵 Enter the maximum collateral amount for this position ($): "
+    elif selected_strategy == 'covered_call':
+        prompt = "\n💵 Enter the maximum amount to spend on this position ($): "
+    else:
+        prompt = "\n💵 Enter the maximum amount you're willing to invest per contract ($): "
+    
     investment_amount = None
     while investment_amount is None:
         try:
-            if selected_strategy == 'cash_secured_put':
-                prompt = "\n💵 Enter the maximum collateral amount for this position ($): "
-            elif selected_strategy == 'covered_call':
-                prompt = "\n💵 Enter the maximum amount to spend on this position ($): "
-            else:
-                prompt = "\n💵 Enter the maximum amount you're willing to invest per contract ($): "
-                
             amount_input = input(prompt)
             investment_amount = parse_float(amount_input)
             if investment_amount <= 0:
@@ -657,10 +953,11 @@ def main():
             print(f"❌ Error: {e}")
     
     # Get user's expected future price for return calculation - MOVED THIS PART EARLIER
-    future_price = None
+    future_price = args.future_price
+    price_prompt = f"\n🔮 Enter your expected price for {ticker_symbol} at expiration: $"
     while future_price is None:
         try:
-            price_input = input(f"\n🔮 Enter your expected price for {ticker_symbol} at expiration: $")
+            price_input = input(price_prompt)
             future_price = parse_float(price_input)
             if future_price <= 0:
                 print("❌ Price must be greater than zero.")
@@ -670,82 +967,77 @@ def main():
     
     # Filter options based on strategy and investment amount
     if selected_strategy == 'call':
-        filtered_options = filter_options_by_investment(calls, selected_strategy, investment_amount, stock_price)
+        filtered_options = filter_options_by_investment(calls, selected_strategy, investment_amount, stock_price, min_volume=args.min_volume)
     elif selected_strategy == 'put':
-        filtered_options = filter_options_by_investment(puts, selected_strategy, investment_amount, stock_price)
+        filtered_options = filter_options_by_investment(puts, selected_strategy, investment_amount, stock_price, min_volume=args.min_volume)
     elif selected_strategy == 'covered_call':
         if stock_price is None:
             print("❌ Error: Current stock price is required for covered call analysis but could not be retrieved.")
-            sys.exit(1)
-        filtered_options = filter_options_by_investment(calls, selected_strategy, investment_amount, stock_price)
+            return 1
+        filtered_options = filter_options_by_investment(calls, selected_strategy, investment_amount, stock_price, min_volume=args.min_volume)
     elif selected_strategy == 'cash_secured_put':
-        filtered_options = filter_options_by_investment(puts, selected_strategy, investment_amount, stock_price)
+        filtered_options = filter_options_by_investment(puts, selected_strategy, investment_amount, stock_price, min_volume=args.min_volume)
     
     # Check if we found any options
-    if not filtered_options:
+    if len(filtered_options.strike) == 0:
         print("\n❌ No options match your criteria. Try adjusting your investment amount.")
-        sys.exit(0)
+        if args.json:
+            # Still write an (empty) array so stdout is valid JSON
+            print_ranked_json(calculate_annualized_returns(filtered_options, selected_strategy, future_price, selected_expiration), json_out)
+        return 0
     
     # Calculate returns based on expected price and sort by annualized return
     options_by_return = calculate_annualized_returns(filtered_options, selected_strategy, future_price, selected_expiration)
     
-    # Display ALL options sorted by annualized return
-    print(f"\n📊 Options sorted by highest annualized return if ${future_price:.2f} is reached:")
+    if args.json:
+        print_ranked_json(options_by_return, json_out)
+        return 0
     
-    # Create table headers and data for all options
-    headers = ["Num", "Strike", "Premium", "Breakeven", "Profit", "Return %", "Annual Return", "Volume", "Open Int"]
-    table_data = []
-    
-    for i, opt in enumerate(options_by_return):
-        volume = opt['option_data'].get('volume', 'N/A')
-        open_int = opt['option_data'].get('openInterest', 'N/A')
-        
-        row = [
-            i+1,
-            f"${opt['strike']:.2f}",
-            f"${opt['premium']:.2f}",
-            f"${opt['breakeven']:.2f}",
-            f"${opt['profit']:.2f}",
-            f"{opt['percent_return']:.2f}%",
-            f"{opt['annualized_return']:.2f}%",
-            volume,
-            open_int
-        ]
-        table_data.append(row)
-    
-    # Display using tabulate
-    print(tabulate(table_data, headers=headers, tablefmt="grid"))
-    
-    print("\n📝 These options are sorted by annualized return if the stock reaches")
-    print(f"   ${future_price:.2f} by expiration. Higher returns may involve higher risks.")
+    # Display options sorted by annualized return
+    # Only the top MAX_ROWS are shown until the user asks for more, but any
+    # option can be selected by number
+    display_ranked_options(options_by_return, future_price, MAX_ROWS)
     
     # Let user select from filtered options or exit
+    num_options = len(options_by_return.strike)
+    showing_all = num_options <= MAX_ROWS
+    select_prompt = f"\n➡️ Select an option by number (1 to {num_options}) or 'q' to quit: "
+    more_prompt = f"\n➡️ Select an option by number (1 to {num_options}), 'm' for more or 'q' to quit: "
     option_choice = None
+    if args.choice is not None:
+        # The range is only known after ranking, so it can't be checked in parse_args
+        if not 1 <= args.choice <= num_options:
+            print(f"❌ --choice must be between 1 and {num_options}.")
+            return 2
+        option_choice = args.choice - 1
     while option_choice is None:
         try:
-            choice_input = input("\n➡️ Select an option by number (1 to " + str(len(options_by_return)) + ") or 'q' to quit: ")
-            if choice_input.lower() == 'q':
+            choice_input = input(select_prompt if showing_all else more_prompt)
+            if choice_input in _QUIT_INPUTS:
                 print("👋 Exiting analysis.")
-                sys.exit(0)
+                return 0
+            
+            if choice_input in _MORE_INPUTS and not showing_all:
+                display_ranked_options(options_by_return, future_price)
+                showing_all = True
+                continue
                 
             choice_idx = int(choice_input) - 1
-            if 0 <= choice_idx < len(options_by_return):
-                option_choice = options_by_return[choice_idx]
+            if 0 <= choice_idx < num_options:
+                option_choice = choice_idx
             else:
-                print(f"❌ Please enter a number between 1 and {len(options_by_return)}.")
+                print(f"❌ Please enter a number between 1 and {num_options}.")
         except ValueError:
             print("❌ Invalid input. Please enter a number or 'q'.")
     
     # Prepare selected data for analysis
     selected_data = {'stock_price': stock_price}
+    selected_strike = options_by_return.strike[option_choice]
+    selected_option = options_by_return.rows.iloc[option_choice]
     
-    if selected_strategy in ['call', 'covered_call']:
-        selected_data['call_strike'] = option_choice['strike']
-        selected_data['call_option'] = option_choice['option_data']
-    
-    if selected_strategy in ['put', 'cash_secured_put']:
-        selected_data['put_strike'] = option_choice['strike']
-        selected_data['put_option'] = option_choice['option_data']
+    leg = _LEG_KIND[selected_strategy]
+    selected_data[f'{leg}_strike'] = selected_strike
+    selected_data[f'{leg}_option'] = selected_option
     
     # Display strategy analysis
     calculate_pnl(selected_strategy, stock_price, selected_data)
@@ -755,6 +1047,7 @@ def main():
     
     # Display future price analysis
     display_future_results(future_results)
+    return 0
 
 if __name__ == "__main__":
-    main() 
\ No newline at end of file
+    sys.exit(main()) 
\ No newline at end of file